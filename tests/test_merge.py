@@ -0,0 +1,84 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import web_transcriptor
+from web_transcriptor import _NEW_SEGMENT, _SKIPPED, _merge_kernel, merge_captions_global
+
+NEW, SKIP = _NEW_SEGMENT, _SKIPPED
+
+
+def _run_plain(kernel, ids, offsets, min_overlap_words, window, longest, vocab, count):
+    overlaps = [0] * count
+    kernel(ids, offsets, min_overlap_words, window, [0] * (2 * window), [0] * longest, [0] * vocab, overlaps)
+    return overlaps
+
+
+def _run_compiled(kernel, ids, offsets, min_overlap_words, window, longest, vocab, count):
+    np = web_transcriptor.np
+    overlaps = np.empty(count, dtype=np.int64)
+    kernel(np.array(ids, dtype=np.uint32), np.array(offsets, dtype=np.int64), min_overlap_words, window,
+           np.empty(2 * window, dtype=np.uint32), np.empty(longest, dtype=np.int64),
+           np.zeros(vocab, dtype=np.int64), overlaps)
+    return overlaps.tolist()
+
+
+class MergeKernelTest(unittest.TestCase):
+    # (captions, min_overlap_words, window, expected overlaps)
+    CASES = {
+        "full overlap": (
+            ["a b c", "a b c"], 3, 256, [NEW, 3]),
+        "overlap below min_overlap_words": (
+            ["a b c d", "c d e"], 3, 256, [NEW, NEW]),
+        "empty caption in the middle": (
+            ["a b c", "", "b c d"], 2, 256, [NEW, SKIP, 2]),
+        "empty first caption": (
+            ["", "a b", "a b c"], 2, 256, [NEW, NEW, 2]),
+        "caption longer than the window": (
+            ["a b c d e f", "e f g"], 2, 4, [NEW, 2]),
+        # "a" has already left the 4-word window, so no overlap is found.
+        "overlap longer than the window": (
+            ["x a b c d e", "a b c d e y"], 2, 4, [NEW, NEW]),
+        # The 6-word tail buffer fills after four captions and is compacted;
+        # "a" and "b" are evicted, so the last caption starts a new segment.
+        "small window forces compaction": (
+            ["a b c", "b c d", "c d e", "d e f", "e f g", "f g h", "a b z"], 2, 3,
+            [NEW, 2, 2, 2, 2, 2, NEW]),
+        "counts are cleared on a new segment": (
+            ["a b c", "x y z", "b c q"], 2, 256, [NEW, NEW, NEW]),
+    }
+
+    def kernels(self):
+        plain = getattr(_merge_kernel, "py_func", _merge_kernel)
+        yield "plain", plain, _run_plain
+        if web_transcriptor.njit is not None:
+            yield "compiled", _merge_kernel, _run_compiled
+
+    def test_overlaps(self):
+        for name, (captions, min_overlap_words, window, expected) in self.CASES.items():
+            word_lists = [caption.split() for caption in captions]
+            word_ids = {}
+            ids = [word_ids.setdefault(word, len(word_ids)) for words in word_lists for word in words]
+            offsets = [0]
+            for words in word_lists:
+                offsets.append(offsets[-1] + len(words))
+            longest = max(1, max(len(words) for words in word_lists))
+            for kind, kernel, run in self.kernels():
+                with self.subTest(name, kernel=kind):
+                    overlaps = run(kernel, ids, offsets, min_overlap_words, window,
+                                   longest, len(word_ids), len(word_lists))
+                    self.assertEqual(overlaps, expected)
+
+
+class MergeCaptionsGlobalTest(unittest.TestCase):
+    def test_merges_overlapping_captions(self):
+        word_lists = [["a", "b", "c"], [], ["b", "c", "d"], ["x", "y"]]
+        merged = merge_captions_global(["1", "2", "3", "4"], ["2", "3", "4", "5"], word_lists, min_overlap_words=2)
+        self.assertEqual(merged, (["1", "4"], ["4", "5"], [["a", "b", "c", "d"], ["x", "y"]]))
+        self.assertEqual(word_lists[0], ["a", "b", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_transcriptor import restore_punctuation_batch
+
+
+class _StubModel:
+    """
+    Stands in for PunctuationModel: one token per word, labelled "." when the
+    word is "end". Words past max_words are dropped, as a tokenizer limit would.
+    """
+
+    def __init__(self, max_words=None):
+        self.max_words = max_words
+        self.calls = 0
+
+    def preprocess(self, text):
+        return text.split()
+
+    def prediction_to_text(self, prediction):
+        return " ".join(word + ("." if label == "." else "") for word, label, _ in prediction)
+
+    def pipe(self, texts, batch_size=None):
+        self.calls += 1
+        results = []
+        for text in texts:
+            result = []
+            end = -1
+            for word in text.split(" ")[:self.max_words]:
+                start = end + 1
+                end = start + len(word)
+                result.append({"entity": "." if word == "end" else "0", "score": 1.0, "start": start, "end": end})
+            results.append(result)
+        return results
+
+
+class RestorePunctuationBatchTest(unittest.TestCase):
+    def test_restores_all_texts_in_one_pipeline_call(self):
+        model = _StubModel()
+        long_text = " ".join(["word"] * 300 + ["end"])
+        restored = restore_punctuation_batch(model, ["a b end", long_text, "a b end"])
+        self.assertEqual(model.calls, 1)
+        self.assertEqual(restored["a b end"], "a b end.")
+        self.assertEqual(restored[long_text], " ".join(["word"] * 300) + " end.")
+
+    def test_clipped_chunk_raises(self):
+        model = _StubModel(max_words=100)
+        with self.assertRaises(ValueError):
+            restore_punctuation_batch(model, [" ".join(["word"] * 150)])
+
+
+if __name__ == "__main__":
+    unittest.main()
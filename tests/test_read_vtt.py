@@ -0,0 +1,83 @@
+import os
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from web_transcriptor import read_vtt
+
+
+def _write_vtt(content):
+    fd, path = tempfile.mkstemp(suffix=".vtt")
+    with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+        f.write(content)
+    return path
+
+
+class ReadVttTest(unittest.TestCase):
+    # (content, expected cues). Except for the character reference case, the
+    # expected cues are what webvtt-py 0.5.1 returns for the same input.
+    CASES = {
+        "whitespace separator": (
+            "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nfirst cue\n \n"
+            "00:00:03.000 --> 00:00:04.000\nsecond cue\n",
+            [("00:00:01.000", "00:00:02.000", "first cue"),
+             ("00:00:03.000", "00:00:04.000", "second cue")]),
+        "tab separator": (
+            "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nfirst cue\n\t\n"
+            "00:00:03.000 --> 00:00:04.000\nsecond\ncue\n",
+            [("00:00:01.000", "00:00:02.000", "first cue"),
+             ("00:00:03.000", "00:00:04.000", "second\ncue")]),
+        "trailing whitespace lines": (
+            "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nhello world how\n \n\n"
+            "00:00:03.000 --> 00:00:04.000\nthird\n\t",
+            [("00:00:01.000", "00:00:02.000", "hello world how"),
+             ("00:00:03.000", "00:00:04.000", "third")]),
+        "identifiers, notes and empty cues": (
+            "WEBVTT\nKind: captions\n\nNOTE a comment\n\n1\n"
+            "00:01.000 --> 00:02.500 align:start\n<c>tagged</c> text\n\n"
+            "2\n00:00:03.000 --> 00:00:04.000\n\n"
+            "00:00:05.000 --> 00:00:06.000\nlast",
+            [("00:00:01.000", "00:00:02.500", "tagged text"),
+             ("00:00:05.000", "00:00:06.000", "last")]),
+        "crlf": (
+            "WEBVTT\r\n\r\n00:00:01.000 --> 00:00:02.000\r\none\r\ntwo\r\n \r\n",
+            [("00:00:01.000", "00:00:02.000", "one\ntwo")]),
+        "text stops at next timing line": (
+            "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nfirst cue\n"
+            "00:00:03.000 --> 00:00:04.000\nsecond cue\n",
+            [("00:00:01.000", "00:00:02.000", "first cue"),
+             ("00:00:03.000", "00:00:04.000", "second cue")]),
+        # webvtt-py leaves character references as-is; read_vtt decodes them.
+        "character references": (
+            "WEBVTT\n\n00:00:01.000 --> 00:00:02.000\nR&amp;D &lt;3\n",
+            [("00:00:01.000", "00:00:02.000", "R&D <3")]),
+    }
+
+    def read(self, content):
+        path = _write_vtt(content)
+        try:
+            return list(read_vtt(path))
+        finally:
+            os.remove(path)
+
+    def test_cues(self):
+        for name, (content, expected) in self.CASES.items():
+            with self.subTest(name):
+                self.assertEqual(self.read(content), expected)
+
+    def test_rejects_files_without_webvtt_signature(self):
+        for content in ["1\n00:00:01,000 --> 00:00:02,000\nan srt cue\n", ""]:
+            with self.subTest(content=content):
+                with self.assertRaises(SystemExit) as raised:
+                    self.read(content)
+                self.assertIn("is not a WEBVTT file", str(raised.exception))
+
+    def test_accepts_signature_after_bom(self):
+        content = "\ufeffWEBVTT\n\n00:00:01.000 --> 00:00:02.000\ntext\n"
+        self.assertEqual(self.read(content), [("00:00:01.000", "00:00:02.000", "text")])
+
+
+if __name__ == "__main__":
+    unittest.main()
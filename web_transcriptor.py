@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
+import os
+import re
 import sys
+import html
+import mmap
+import glob
 import argparse
-import webvtt
+import hashlib
+import threading
 import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 warnings.filterwarnings("ignore", category=UserWarning, module="transformers")
 
 # Import deepmultilingualpunctuation only for full processing.
@@ -11,165 +18,552 @@ try:
 except ImportError:
     PunctuationModel = None
 
+# diskcache is only needed for --punct-cache.
+try:
+    import diskcache
+except ImportError:
+    diskcache = None
+
+# numba is optional; without it the merge kernel runs as plain Python.
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+PUNCT_CACHE_DIR = ".wt_punct_cache"
+
+PUNCT_MODEL_NAME = "oliverguhr/fullstop-punctuation-multilang-large"
+
+HTML_HEADER = b"""<!DOCTYPE html>
+<html>
+<head>
+  <meta charset='utf-8'>
+  <title>Transcript</title>
+  <style>
+    body { font-family: sans-serif; padding: 20px; line-height: 1.5; }
+    .caption, .segment { margin-bottom: 1em; }
+    .timestamp { color: #555; font-size: 0.9em; }
+    .text { margin: 0.2em 0 0 0; }
+  </style>
+</head>
+<body>
+  <h1>Transcript</h1>
+"""
+HTML_FOOTER = b"</body>\n</html>\n"
+
+# Escapes text for HTML in a single str.translate pass.
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# HTML is encoded to UTF-8 fragment by fragment and written to the output file
+# through a 1 MiB binary buffer, bypassing the text-mode wrapper.
+HTML_WRITE_BUFFER = 1 << 20
+
+CUE_TIMINGS_PATTERN = re.compile(rb'\s*((?:\d+:)?\d{2}:\d{2}\.\d{3})\s*-->\s*((?:\d+:)?\d{2}:\d{2}\.\d{3})')
+CUE_TAGS_PATTERN = re.compile(r'<.*?>')
+
+def _format_timestamp(value):
+    """
+    Normalize a cue timestamp to HH:MM:SS.mmm.
+    """
+    parts = value.decode('ascii').split(':')
+    if len(parts) == 2:
+        parts.insert(0, '00')
+    return f"{int(parts[0]):02d}:{parts[1]}:{parts[2]}"
+
+def _make_cue(timing, text):
+    """
+    Build a (start, end, text) tuple from a CUE_TIMINGS_PATTERN match and the
+    raw bytes of the cue text.
+    """
+    return (_format_timestamp(timing.group(1)), _format_timestamp(timing.group(2)),
+            html.unescape(CUE_TAGS_PATTERN.sub('', text.decode('utf-8'))))
+
+def read_vtt(vtt_file):
+    """
+    Stream the cues of a WEBVTT file as (start, end, text) tuples, with cue tags
+    removed from the text and character references (&amp; etc.) decoded.
+    The file is memory-mapped and scanned line by line; only the timing line
+    and the text of each cue are decoded.
+    Exits with an error if the file does not start with the WEBVTT signature.
+    """
+    with open(vtt_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            sys.exit(f"Error: {vtt_file} is not a WEBVTT file.")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            signature = 3 if data[:3] == b'\xef\xbb\xbf' else 0
+            if data[signature:signature + 6] != b'WEBVTT':
+                sys.exit(f"Error: {vtt_file} is not a WEBVTT file.")
+            if data.find(b'\r') != -1:
+                data = data[:].replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+            size = len(data)
+            timing = None
+            text_start = 0
+            pos = 0
+            while pos <= size:
+                line_end = data.find(b'\n', pos)
+                if line_end == -1:
+                    line_end = size
+                line = data[pos:line_end]
+                # A blank or whitespace-only line ends the current cue, and so does
+                # a line containing '-->', which is the timing line of the next one.
+                # Cues without any text lines are dropped, as webvtt-py does.
+                has_arrow = b'-->' in line
+                if has_arrow or not line.strip():
+                    if timing is not None and pos > text_start:
+                        yield _make_cue(timing, data[text_start:pos - 1])
+                    timing = CUE_TIMINGS_PATTERN.match(line) if has_arrow else None
+                    text_start = line_end + 1
+                pos = line_end + 1
+            if timing is not None and size > text_start:
+                yield _make_cue(timing, data[text_start:size])
+
+def _write_html(html_file, rows, css_class):
+    """
+    Write (start, end, text) rows to html_file as a transcript page, one
+    <div class='css_class'> per row with non-empty text.
+    """
+    with open(html_file, 'wb', buffering=HTML_WRITE_BUFFER) as f:
+        f.write(HTML_HEADER)
+        for start, end, text in rows:
+            if text:
+                f.write(f"  <div class='{css_class}'>\n    <div class='timestamp'>{start} — {end}</div>\n    <p class='text'>{text.translate(_HTML_ESCAPE)}</p>\n  </div>\n".encode('utf-8'))
+        f.write(HTML_FOOTER)
+    print(f"HTML transcript saved to {html_file}")
+
 def convert_vtt_to_html_minimal(vtt_file, html_file):
     """
     Minimal processing: Output each caption as-is, with its timestamp and text.
     """
-    captions = list(webvtt.read(vtt_file))
-    
-    html = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        "  <meta charset='utf-8'>",
-        "  <title>Transcript</title>",
-        "  <style>",
-        "    body { font-family: sans-serif; padding: 20px; line-height: 1.5; }",
-        "    .caption { margin-bottom: 1em; }",
-        "    .timestamp { color: #555; font-size: 0.9em; }",
-        "    .text { margin: 0.2em 0 0 0; }",
-        "  </style>",
-        "</head>",
-        "<body>",
-        "  <h1>Transcript</h1>"
-    ]
+    _write_html(html_file, ((start, end, text.strip()) for start, end, text in read_vtt(vtt_file)), "caption")
+
+def read_captions(vtt_file):
+    """
+    Read a WEBVTT file into three parallel lists: starts, ends and word_lists,
+    where each caption's text is split into words once, up front.
+    """
+    starts, ends, word_lists = [], [], []
+    for start, end, text in read_vtt(vtt_file):
+        starts.append(start)
+        ends.append(end)
+        word_lists.append(text.split())
+    return starts, ends, word_lists
+
+# An overlap can never be longer than a single caption, so only this many trailing
+# words of the running segment are searched.
+_OVERLAP_WINDOW_WORDS = 256
+
+# Per-caption results of _merge_kernel besides the overlap length itself.
+_NEW_SEGMENT = -1
+_SKIPPED = -2
+
+def _merge_kernel(ids, offsets, min_overlap_words, window, tail, fail, counts, overlaps):
+    """
+    Overlap search over interned word ids. Caption c is ids[offsets[c]:offsets[c + 1]].
+    For each caption, overlaps[c] is set to the number of leading words that
+    repeat the end of the current segment, to _NEW_SEGMENT if the caption starts
+    a new segment, or to _SKIPPED if it is empty.
+    The overlap is the longest prefix of the caption that is a suffix of the last
+    window words of the segment, found with the KMP failure function of the caption
+    over the last m words of that window, where m is the caption length.
+    counts[id] tracks how often each word occurs in that window, so captions whose
+    first word is not in it skip the search.
+    tail (at least 2 * window long), fail (as long as the longest caption) and
+    counts (one zeroed entry per word id) are scratch buffers. Written in the
+    subset of Python numba can compile.
+    """
+    tail_start = 0
+    tail_end = 0
+    for c in range(len(offsets) - 1):
+        lo = offsets[c]
+        m = offsets[c + 1] - lo
+        if c > 0 and m == 0:
+            overlaps[c] = _SKIPPED
+            continue
+
+        overlap = 0
+        if c > 0 and counts[ids[lo]] > 0:
+            fail[0] = 0
+            k = 0
+            for i in range(1, m):
+                while k > 0 and ids[lo + k] != ids[lo + i]:
+                    k = fail[k - 1]
+                if ids[lo + k] == ids[lo + i]:
+                    k += 1
+                fail[i] = k
+            # The overlap is at most m words long, so only the last m words of
+            # the window can take part in it.
+            k = 0
+            for j in range(max(tail_start, tail_end - m), tail_end):
+                if k == m:
+                    k = fail[k - 1]
+                while k > 0 and ids[lo + k] != tail[j]:
+                    k = fail[k - 1]
+                if ids[lo + k] == tail[j]:
+                    k += 1
+            overlap = k
+
+        if c > 0 and overlap >= min_overlap_words:
+            overlaps[c] = overlap
+        else:
+            overlaps[c] = _NEW_SEGMENT
+            overlap = 0
+            for j in range(tail_start, tail_end):
+                counts[tail[j]] -= 1
+            tail_start = 0
+            tail_end = 0
+
+        # Slide the new words into the window. tail[tail_start:tail_end] holds the
+        # window; when the buffer is full it is moved back to the front, so each
+        # word is copied O(1) times on average.
+        add = min(m - overlap, window)
+        leave = max(0, tail_end - tail_start + add - window)
+        for j in range(tail_start, tail_start + leave):
+            counts[tail[j]] -= 1
+        tail_start += leave
+        if tail_end + add > len(tail):
+            for j in range(tail_end - tail_start):
+                tail[j] = tail[tail_start + j]
+            tail_end -= tail_start
+            tail_start = 0
+        for j in range(add):
+            word = ids[offsets[c + 1] - add + j]
+            tail[tail_end + j] = word
+            counts[word] += 1
+        tail_end += add
+
+if njit is not None:
+    _merge_kernel = njit(cache=True)(_merge_kernel)
+
+def merge_captions_global(starts, ends, word_lists, min_overlap_words=3):
+    """
+    Merge consecutive captions by removing overlapping words.
+    Takes the parallel lists from read_captions and returns the segments as
+    three parallel lists: (seg_starts, seg_ends, seg_words).
+    """
+    if not starts:
+        return [], [], []
     
-    for caption in captions:
-        text = caption.text.strip()
-        if text:
-            html.append("  <div class='caption'>")
-            html.append(f"    <div class='timestamp'>{caption.start} — {caption.end}</div>")
-            html.append(f"    <p class='text'>{text}</p>")
-            html.append("  </div>")
+    # Intern words to integer ids so the overlap search only compares integers.
+    word_ids = {}
+    ids = [word_ids.setdefault(word, len(word_ids)) for words in word_lists for word in words]
+    offsets = [0]
+    for words in word_lists:
+        offsets.append(offsets[-1] + len(words))
+    longest = max(1, max(len(words) for words in word_lists))
     
-    html.append("</body>")
-    html.append("</html>")
+    if njit is not None:
+        overlaps = np.empty(len(word_lists), dtype=np.int64)
+        _merge_kernel(np.array(ids, dtype=np.uint32), np.array(offsets, dtype=np.int64), min_overlap_words,
+                      _OVERLAP_WINDOW_WORDS, np.empty(2 * _OVERLAP_WINDOW_WORDS, dtype=np.uint32),
+                      np.empty(longest, dtype=np.int64), np.zeros(len(word_ids), dtype=np.int64), overlaps)
+        overlaps = overlaps.tolist()
+    else:
+        overlaps = [0] * len(word_lists)
+        _merge_kernel(ids, offsets, min_overlap_words, _OVERLAP_WINDOW_WORDS,
+                      [0] * (2 * _OVERLAP_WINDOW_WORDS), [0] * longest, [0] * len(word_ids), overlaps)
     
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write("\n".join(html))
-    print(f"HTML transcript saved to {html_file}")
+    seg_starts, seg_ends, seg_words = [], [], []
+    for i, overlap in enumerate(overlaps):
+        if overlap == _NEW_SEGMENT:
+            seg_starts.append(starts[i])
+            seg_ends.append(ends[i])
+            seg_words.append(list(word_lists[i]))
+        elif overlap != _SKIPPED:
+            seg_words[-1].extend(word_lists[i][overlap:])
+            seg_ends[-1] = ends[i]
+
+    return seg_starts, seg_ends, seg_words
 
-def merge_captions_global(captions, min_overlap_words=3):
+def refine_segments(seg_starts, seg_ends, seg_words, min_words=3):
     """
-    Merge consecutive captions by removing overlapping text.
-    Returns a list of segments as tuples: (start, end, merged_text).
+    Merge segments that are very short (fewer than min_words) with the previous segment.
+    Takes and returns the parallel lists produced by merge_captions_global.
     """
-    if not captions:
-        return []
-    
-    current_start = captions[0].start
-    current_end = captions[0].end
-    current_text = captions[0].text.strip()
-    merged_segments = []
-    
-    for caption in captions[1:]:
-        curr_text = caption.text.strip()
-        if not curr_text:
-            continue
-        
-        curr_words = curr_text.split()
-        overlap_found = 0
-        # Look for the longest prefix (with at least min_overlap_words) of curr_text that appears in current_text.
-        for i in range(len(curr_words), min_overlap_words - 1, -1):
-            prefix = " ".join(curr_words[:i])
-            if prefix in current_text:
-                overlap_found = i
-                break
-        
-        if overlap_found >= min_overlap_words:
-            non_overlap = " ".join(curr_words[overlap_found:])
-            if non_overlap:
-                current_text += " " + non_overlap
-            current_end = caption.end
+    refined_starts, refined_ends, refined_words = [], [], []
+    # The last refined word list is copied the first time something is merged
+    # into it, then extended in place, so the input lists are never modified.
+    last_copied = False
+    for start, end, words in zip(seg_starts, seg_ends, seg_words):
+        if refined_words and len(words) < min_words:
+            if not last_copied:
+                refined_words[-1] = list(refined_words[-1])
+                last_copied = True
+            refined_words[-1].extend(words)
+            refined_ends[-1] = end
         else:
-            merged_segments.append((current_start, current_end, current_text))
-            current_start = caption.start
-            current_end = caption.end
-            current_text = curr_text
+            refined_starts.append(start)
+            refined_ends.append(end)
+            refined_words.append(words)
+            last_copied = False
+    return refined_starts, refined_ends, refined_words
 
-    merged_segments.append((current_start, current_end, current_text))
-    return merged_segments
+# One PunctuationModel per process for each quantize setting.
+_PUNCT_MODELS = {}
+_PUNCT_LOCK = threading.Lock()
 
-def refine_segments(segments, min_words=3):
+def _punct_variant(quantize):
     """
-    Merge segments whose text is very short (fewer than min_words) with the previous segment.
+    Return the variant _get_punct_model loads for the quantize setting, without
+    loading the model: "fp16" when CUDA is available, otherwise "int8" with
+    quantize and "fp32" without.
     """
-    refined = []
-    for seg in segments:
-        if refined and len(seg[2].split()) < min_words:
-            prev_start, prev_end, prev_text = refined.pop()
-            merged_text = prev_text + " " + seg[2]
-            refined.append((prev_start, seg[1], merged_text.strip()))
-        else:
-            refined.append(seg)
-    return refined
+    import torch
+    if torch.cuda.is_available():
+        return "fp16"
+    return "int8" if quantize else "fp32"
 
-def convert_vtt_to_html_full(vtt_file, html_file):
+def _get_punct_model(quantize=False):
     """
-    Full processing: Merge overlapping captions, refine segments,
-    and restore punctuation using deepmultilingualpunctuation.
+    Return the process-wide PunctuationModel, loading it on first use.
+    Loading the model takes seconds, so every conversion in a process shares it.
+    When CUDA is available the model runs on the GPU in half precision. Otherwise,
+    with quantize, its Linear layers are converted to dynamic int8 quantization,
+    which runs faster on CPU at the cost of slightly different output.
+    model.variant records which of these (see _punct_variant) is in use.
+    """
+    model = _PUNCT_MODELS.get(quantize)
+    if model is None:
+        with _PUNCT_LOCK:
+            model = _PUNCT_MODELS.get(quantize)
+            if model is None:
+                import torch
+                model = PunctuationModel(PUNCT_MODEL_NAME)
+                model.variant = _punct_variant(quantize)
+                if model.variant == "fp16":
+                    if model.pipe.device.type != "cuda":
+                        model.pipe.device = torch.device("cuda:0")
+                    model.pipe.model = model.pipe.model.to(model.pipe.device).half()
+                    if quantize:
+                        print("Warning: --quantize only applies to CPU inference; running the model in half precision on the GPU.")
+                elif model.variant == "int8":
+                    model.pipe.model = torch.quantization.quantize_dynamic(
+                        model.pipe.model, {torch.nn.Linear}, dtype=torch.qint8)
+                _PUNCT_MODELS[quantize] = model
+    return model
+
+def _punctuation_chunks(words, chunk_size=230, overlap=5):
+    """
+    Split words into chunks the model can take in one pass (chunk_size words,
+    which stays under its 512-token limit). Returns a list of (chunk_words, keep)
+    pairs, where keep is the number of leading words whose labels are used; the
+    other overlap words only give context and are labelled by the next chunk.
+    Unlike PunctuationModel.predict, long texts are cut into chunks of nearly
+    equal length rather than full chunks plus a short remainder, so batched
+    chunks need less padding.
+    """
+    if len(words) <= chunk_size:
+        return [(words, len(words))]
+    count = -(-len(words) // (chunk_size - overlap))
+    bounds = [i * len(words) // count for i in range(count + 1)]
+    return [(words[lo:hi + overlap], hi - lo) for lo, hi in zip(bounds, bounds[1:])]
+
+def _punct_cache_key(variant, text):
+    """
+    Cache key for a text: the model name and variant (see _punct_variant) plus a
+    short blake2b digest of the text. It is built without loading the model.
+    """
+    return (PUNCT_MODEL_NAME, variant, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest())
+
+def restore_punctuation_batch(model, texts, batch_size=32):
+    """
+    Restore punctuation for many texts with batched calls to the model's pipeline
+    instead of one restore_punctuation call per text.
+    Returns a dict mapping each input text to its punctuated version.
+    """
+    restored = {}
+    chunk_owner = []
+    chunk_words = []
+    chunk_keep = []
+    tagged = {}
+    for text in texts:
+        if text in tagged or text in restored:
+            continue
+        words = model.preprocess(text)
+        if not words:
+            restored[text] = ""
+            continue
+        tagged[text] = []
+        for chunk, keep in _punctuation_chunks(words):
+            chunk_owner.append(text)
+            chunk_words.append(chunk)
+            chunk_keep.append(keep)
+
+    # Run similar-length chunks together to keep padding to a minimum.
+    chunk_texts = [" ".join(chunk) for chunk in chunk_words]
+    order = sorted(range(len(chunk_texts)), key=lambda i: len(chunk_texts[i]))
+    results = [None] * len(chunk_texts)
+    if order:
+        outputs = model.pipe([chunk_texts[i] for i in order], batch_size=batch_size)
+        for i, result in zip(order, outputs):
+            results[i] = result
+
+    # Label each word from its sub-tokens, as PunctuationModel.predict does,
+    # and stitch the chunks of each text back together.
+    for owner, words, keep, chunk_text, result in zip(chunk_owner, chunk_words, chunk_keep, chunk_texts, results):
+        # The pipeline truncates input beyond the tokenizer limit; labels for the
+        # clipped words would silently come out as "0".
+        if not result or result[-1]["end"] != len(chunk_text):
+            raise ValueError("chunk size too large, text got clipped")
+        char_index = 0
+        result_index = 0
+        score = 0.0
+        for word in words[:keep]:
+            char_index += len(word) + 1
+            label = "0"
+            while result_index < len(result) and char_index > result[result_index]["end"]:
+                label = result[result_index]["entity"]
+                score = result[result_index]["score"]
+                result_index += 1
+            tagged[owner].append([word, label, score])
+
+    for text, prediction in tagged.items():
+        restored[text] = model.prediction_to_text(prediction)
+    return restored
+
+def _check_full_mode_dependencies(punct_cache):
+    """
+    Exit with an error if a package needed for full processing is missing.
     """
     if PunctuationModel is None:
         sys.exit("Error: deepmultilingualpunctuation is not installed. Please run 'pip install deepmultilingualpunctuation'.")
+    if punct_cache and diskcache is None:
+        sys.exit("Error: diskcache is not installed. Please run 'pip install diskcache' or drop --punct-cache.")
+
+def _merge_vtt(vtt_file):
+    """
+    Read a WEBVTT file, then merge and refine its captions into segments.
+    Returns parallel lists (seg_starts, seg_ends, seg_texts).
+    """
+    seg_starts, seg_ends, seg_words = merge_captions_global(*read_captions(vtt_file), min_overlap_words=3)
+    seg_starts, seg_ends, seg_words = refine_segments(seg_starts, seg_ends, seg_words, min_words=3)
+    return seg_starts, seg_ends, [" ".join(words) for words in seg_words]
+
+def _restore_punctuation(texts, punct_cache, quantize):
+    """
+    Restore punctuation for texts with the shared model. With punct_cache, texts
+    found in the on-disk cache skip the model, and the model is only loaded if
+    some text is missing from the cache.
+    """
+    texts = list(dict.fromkeys(texts))
+    if not punct_cache:
+        return restore_punctuation_batch(_get_punct_model(quantize), texts) if texts else {}
     
-    captions = list(webvtt.read(vtt_file))
-    segments = merge_captions_global(captions, min_overlap_words=3)
-    segments = refine_segments(segments, min_words=3)
-    
-    # Initialize the punctuation restoration model.
-    model = PunctuationModel()
-    
-    html = [
-        "<!DOCTYPE html>",
-        "<html>",
-        "<head>",
-        "  <meta charset='utf-8'>",
-        "  <title>Transcript</title>",
-        "  <style>",
-        "    body { font-family: sans-serif; padding: 20px; line-height: 1.5; }",
-        "    .segment { margin-bottom: 1em; }",
-        "    .timestamp { color: #555; font-size: 0.9em; }",
-        "    .text { margin: 0.2em 0 0 0; }",
-        "  </style>",
-        "</head>",
-        "<body>",
-        "  <h1>Transcript</h1>"
-    ]
+    variant = _punct_variant(quantize)
+    restored = {}
+    with diskcache.Cache(PUNCT_CACHE_DIR) as cache:
+        keys = {text: _punct_cache_key(variant, text) for text in texts}
+        for text, key in keys.items():
+            cached = cache.get(key)
+            if cached is not None:
+                restored[text] = cached
+        misses = [text for text in texts if text not in restored]
+        if misses:
+            fresh = restore_punctuation_batch(_get_punct_model(quantize), misses)
+            for text in misses:
+                cache[keys[text]] = fresh[text]
+            restored.update(fresh)
+    return restored
+
+def _write_segments_html(html_file, seg_starts, seg_ends, seg_texts, punctuated):
+    """
+    Write merged segments to html_file, using the punctuated text from punctuated.
+    """
+    _write_html(html_file, ((start, end, punctuated[text])
+                            for start, end, text in zip(seg_starts, seg_ends, seg_texts) if text), "segment")
+
+def convert_vtt_to_html_full(vtt_file, html_file, punct_cache=False, quantize=False):
+    """
+    Full processing: Merge overlapping captions, refine segments,
+    and restore punctuation using deepmultilingualpunctuation.
+    With punct_cache, punctuation results are kept on disk in PUNCT_CACHE_DIR
+    and reused across runs. The model runs on the GPU when one is available;
+    otherwise, with quantize, it runs with int8 dynamic quantization on CPU.
+    """
+    _check_full_mode_dependencies(punct_cache)
     
-    for start, end, text in segments:
-        if text.strip():
-            # Restore punctuation and capitalization.
-            text_with_punctuation = model.restore_punctuation(text)
-            html.append("  <div class='segment'>")
-            html.append(f"    <div class='timestamp'>{start} — {end}</div>")
-            html.append(f"    <p class='text'>{text_with_punctuation}</p>")
-            html.append("  </div>")
+    seg_starts, seg_ends, seg_texts = _merge_vtt(vtt_file)
+    # Restore punctuation and capitalization for all segments at once.
+    punctuated = _restore_punctuation([text for text in seg_texts if text], punct_cache, quantize)
+    _write_segments_html(html_file, seg_starts, seg_ends, seg_texts, punctuated)
+
+def convert_vtt_to_html(vtt_file, html_file, mode="full", punct_cache=False, quantize=False):
+    """
+    Convert a WEBVTT file to an HTML transcript with the given processing mode,
+    'minimal' or 'full'. punct_cache and quantize only apply to full mode.
+    """
+    if mode == "minimal":
+        convert_vtt_to_html_minimal(vtt_file, html_file)
+    else:
+        convert_vtt_to_html_full(vtt_file, html_file, punct_cache=punct_cache, quantize=quantize)
+
+def convert_batch(input_glob, output_dir, mode="full", punct_cache=False, quantize=False):
+    """
+    Convert every WEBVTT file matching input_glob into output_dir/<name>.html.
+    Files are parsed and merged in parallel worker processes. In full mode the
+    punctuation model is loaded once and run over the segments of all files in
+    one batched pass, then the HTML files are written from a thread pool.
+    """
+    vtt_files = sorted(glob.glob(input_glob))
+    if not vtt_files:
+        sys.exit(f"Error: no files match {input_glob!r}.")
+    html_files = [os.path.join(output_dir, os.path.splitext(os.path.basename(vtt_file))[0] + ".html")
+                  for vtt_file in vtt_files]
+    if len(set(html_files)) < len(html_files):
+        sys.exit(f"Error: files matching {input_glob!r} share names, so their outputs would collide in {output_dir}.")
+    if mode == "full":
+        _check_full_mode_dependencies(punct_cache)
+    os.makedirs(output_dir, exist_ok=True)
     
-    html.append("</body>")
-    html.append("</html>")
+    if mode == "minimal":
+        with ProcessPoolExecutor() as pool:
+            list(pool.map(convert_vtt_to_html_minimal, vtt_files, html_files))
+        return
     
-    with open(html_file, 'w', encoding='utf-8') as f:
-        f.write("\n".join(html))
-    print(f"HTML transcript saved to {html_file}")
+    with ProcessPoolExecutor() as pool:
+        merged = list(pool.map(_merge_vtt, vtt_files))
+    punctuated = _restore_punctuation(
+        [text for _, _, seg_texts in merged for text in seg_texts if text], punct_cache, quantize)
+    with ThreadPoolExecutor() as pool:
+        futures = [pool.submit(_write_segments_html, html_file, *segments, punctuated)
+                   for html_file, segments in zip(html_files, merged)]
+        for future in futures:
+            future.result()
 
 def main():
     parser = argparse.ArgumentParser(
         description="Convert a WEBVTT transcript file into a nicely formatted HTML transcript."
     )
-    parser.add_argument("input", help="Input WEBVTT file")
-    parser.add_argument("output", help="Output HTML file")
+    parser.add_argument("input", help="Input WEBVTT file (a glob pattern with --batch)")
+    parser.add_argument("output", help="Output HTML file (a directory with --batch)")
     parser.add_argument(
         "--mode",
         choices=["minimal", "full"],
         default="full",
         help="Processing mode: 'minimal' (no merging/punctuation) or 'full' (advanced processing). Default is full."
     )
+    parser.add_argument(
+        "--punct-cache",
+        action="store_true",
+        help=f"Cache punctuation results on disk in {PUNCT_CACHE_DIR} and reuse them across runs (full mode only, needs diskcache)."
+    )
+    parser.add_argument(
+        "--quantize",
+        action="store_true",
+        help="Run the punctuation model with int8 dynamic quantization (CPU only, faster but output may differ slightly)."
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="Convert every file matching the input glob pattern into the output directory, loading the punctuation model only once."
+    )
     args = parser.parse_args()
     
-    if args.mode == "minimal":
-        convert_vtt_to_html_minimal(args.input, args.output)
+    if args.batch:
+        convert_batch(args.input, args.output, mode=args.mode, punct_cache=args.punct_cache, quantize=args.quantize)
     else:
-        convert_vtt_to_html_full(args.input, args.output)
+        convert_vtt_to_html(args.input, args.output, mode=args.mode, punct_cache=args.punct_cache, quantize=args.quantize)
 
 if __name__ == "__main__":
     main()